@@ -1,61 +1,176 @@
-import csv
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
-from collections import defaultdict
-import seaborn as sns
 import argparse
+import hashlib
 import sys
 import os
+import tempfile
 import warnings
 
-# Suppress warnings for cleaner output
-warnings.filterwarnings('ignore')
+def load_libraries(backend=None):
+    """Import the plotting and data libraries into module scope.
+
+    These take over a second to import, so when run as a script main() only
+    loads them once the command line has been parsed and the input paths
+    checked. Importing this file as a module loads them straight away.
+    """
+    global plt, np, pd, sns
+
+    import matplotlib
+    if backend is not None:
+        matplotlib.use(backend)
+    import matplotlib.pyplot as plt
+    import numpy as np
+    import pandas as pd
+    import seaborn as sns
+
+REQUIRED_COLUMNS = [
+    'algorithm', 'grid_size', 'num_walls', 'num_obstacles', 'success',
+    'total_moves', 'optimal_path_length', 'route_efficiency',
+    'execution_time_ms', 'average_find_path_time_ns', 'total_pathfinding_calls'
+]
+
+OPTIONAL_COLUMNS = ['a_star_calls', 'd_star_calls']
+
+# Read algorithm as categorical so filtering and grouping work on codes.
+# Integer counters fit in int32 (execution_time_ms is a whole number of
+# milliseconds, so int32 keeps it exact where float32 would round large
+# values). route_efficiency only feeds plots and 3-decimal summaries, so
+# float32 is enough; average_find_path_time_ns stays 64-bit as it can exceed
+# float32's exact integer range.
+COLUMN_DTYPES = {
+    'algorithm': 'category',
+    'grid_size': 'int32',
+    'num_walls': 'int32',
+    'num_obstacles': 'int32',
+    'success': 'bool',
+    'total_moves': 'int32',
+    'optimal_path_length': 'int32',
+    'route_efficiency': 'float32',
+    'execution_time_ms': 'int32',
+    'average_find_path_time_ns': 'float64',
+    'total_pathfinding_calls': 'int32',
+    'a_star_calls': 'int32',
+    'd_star_calls': 'int32'
+}
+
+def load_csv(csv_path):
+    """Read the input CSV with explicit column dtypes"""
+    # Only parse the columns the analysis uses; missing required columns
+    # are reported by validate_csv_columns
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [col for col in REQUIRED_COLUMNS + OPTIONAL_COLUMNS if col in header]
+    return pd.read_csv(csv_path, usecols=usecols,
+                       dtype={col: COLUMN_DTYPES[col] for col in usecols})
 
 def validate_csv_columns(df):
     """Validate that required columns exist in the CSV file"""
-    required_columns = [
-        'algorithm', 'grid_size', 'num_walls', 'num_obstacles', 'success',
-        'total_moves', 'optimal_path_length', 'route_efficiency',
-        'execution_time_ms', 'average_find_path_time_ns', 'total_pathfinding_calls'
-    ]
-
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
     if missing_columns:
         raise ValueError(f"Missing required columns: {missing_columns}")
 
-    # Check for optional columns
-    optional_columns = ['a_star_calls', 'd_star_calls']
-    for col in optional_columns:
-        if col not in df.columns:
-            df[col] = 0
-
-    return df
+    # Fill absent optional columns with zeros
+    return df.reindex(columns=REQUIRED_COLUMNS + OPTIONAL_COLUMNS, fill_value=0)
 
 def calculate_metrics(df):
     """Calculate derived metrics for analysis"""
-    df = df.copy()
-
-    # Filter to only include a_star and d_star_lite algorithms
-    df = df[df['algorithm'].isin(['a_star', 'd_star_lite'])]
-
-    # Calculate density metrics
-    df['grid_area'] = df['grid_size'] ** 2
-    df['obstacle_density'] = df['num_obstacles'] / df['grid_area']
-    df['wall_density'] = df['num_walls'] / df['grid_area']
-    df['total_density'] = (df['num_obstacles'] + df['num_walls']) / df['grid_area']
-    df['combined_difficulty'] = df['num_obstacles'] + df['num_walls']
-
-    # Create difficulty categories
-    df['difficulty_category'] = pd.cut(
-        df['total_density'],
-        bins=[0, 0.1, 0.3, 0.5, 1.0],
-        labels=['Low', 'Medium', 'High', 'Extreme'],
-        include_lowest=True
+    # Filter to only include a_star and d_star_lite algorithms. Narrowing the
+    # categories turns every other algorithm into a missing code, so the filter
+    # is a null check on integer codes rather than a string comparison.
+    df = df.assign(
+        algorithm=df['algorithm'].cat.set_categories(['a_star', 'd_star_lite'])
+    ).dropna(subset=['algorithm'])
+
+    grid_area = df['grid_size'] ** 2
+    combined_difficulty = df['num_obstacles'] + df['num_walls']
+    total_density = combined_difficulty / grid_area
+
+    # Add every derived column in a single assign rather than one insert each.
+    # Derived values are only plotted or averaged, so store them as float32.
+    # Difficulty categories are cut from the float64 density so values sitting
+    # exactly on a boundary (e.g. 0.1) keep their category.
+    return df.assign(
+        # Density metrics
+        grid_area=grid_area,
+        obstacle_density=(df['num_obstacles'] / grid_area).astype('float32'),
+        total_density=total_density.astype('float32'),
+        combined_difficulty=combined_difficulty,
+        # Difficulty categories
+        difficulty_category=pd.cut(
+            total_density,
+            bins=[0, 0.1, 0.3, 0.5, 1.0],
+            labels=['Low', 'Medium', 'High', 'Extreme'],
+            include_lowest=True
+        ),
+        # Convert nanoseconds to milliseconds for better readability
+        find_path_time_ms=(df['average_find_path_time_ns'] / 1000000).astype('float32')
     )
 
-    # Convert nanoseconds to milliseconds for better readability
-    df['find_path_time_ms'] = df['average_find_path_time_ns'] / 1000000
+def get_cache_path(csv_path):
+    """Cache file for a CSV, keyed on its absolute path so each CSV has one entry"""
+    key = os.path.abspath(csv_path)
+    return os.path.join('.cache', hashlib.md5(key.encode()).hexdigest() + '.parquet')
+
+def get_cache_fingerprint(csv_path):
+    """Identify the CSV contents and the code that processed them.
+
+    Combines the CSV's modification time and size with a hash of this script,
+    so editing either the data or the loading code (dtypes, derived metrics)
+    invalidates the cache entry.
+    """
+    stat = os.stat(csv_path)
+    with open(__file__, 'rb') as f:
+        source_hash = hashlib.md5(f.read()).hexdigest()
+    return f"{source_hash}:{stat.st_mtime_ns}:{stat.st_size}"
+
+def write_cache(df, cache_path, fingerprint):
+    """Write the cache through a temporary file so readers never see a partial file"""
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    os.close(fd)
+    try:
+        # mkstemp creates the file as 0600; give it the usual umask-based mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+
+        # The fingerprint travels in the Parquet metadata via DataFrame.attrs
+        df.attrs['cache_fingerprint'] = fingerprint
+        try:
+            df.to_parquet(tmp_path)
+        finally:
+            del df.attrs['cache_fingerprint']
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def load_analysis_data(csv_path, use_cache=True, refresh_cache=False):
+    """Load, validate and derive metrics, reusing a Parquet cache of the result.
+
+    use_cache=False neither reads nor writes the cache; refresh_cache=True
+    skips reading it but rewrites it from the CSV.
+    """
+    cache_path = get_cache_path(csv_path)
+    fingerprint = get_cache_fingerprint(csv_path)
+
+    if use_cache and not refresh_cache and os.path.exists(cache_path):
+        try:
+            cached = pd.read_parquet(cache_path)
+            if cached.attrs.pop('cache_fingerprint', None) == fingerprint:
+                return cached
+        except Exception:
+            # Unreadable or corrupt cache: recompute and overwrite it below
+            pass
+
+    df = calculate_metrics(validate_csv_columns(load_csv(csv_path)))
+
+    if use_cache:
+        try:
+            # Overwrites any stale entry for this CSV in place
+            write_cache(df, cache_path, fingerprint)
+        except (ImportError, OSError):
+            # Parquet needs pyarrow; without it every run re-parses the CSV
+            pass
 
     return df
 
@@ -74,61 +189,76 @@ def safe_plot_line(ax, x_data, y_data, algorithm, marker='o', **kwargs):
 
     ax.plot(x_clean, y_clean, marker=marker, label=algorithm, linewidth=2, **kwargs)
 
-def create_density_bins(data, column, num_bins=20):
-    """Create density bins for better visualization"""
-    if data.empty or column not in data.columns:
-        return data, []
+def create_density_bins(values, num_bins=20):
+    """Equal-count bin edges over values and the bin index of each value"""
+    if len(values) == 0:
+        return np.array([]), np.array([], dtype=np.intp)
+
+    # Quantile edges keep bins populated when densities are skewed; tied
+    # values collapse duplicate edges into fewer, wider bins
+    edges = np.unique(np.quantile(values, np.linspace(0, 1, num_bins + 1)))
 
-    min_val = data[column].min()
-    max_val = data[column].max()
+    if len(edges) <= 1:
+        return edges, np.zeros(len(values), dtype=np.intp)
 
-    if min_val == max_val:
-        return data, [min_val]
+    # Right-closed bins like pd.cut; the minimum falls below the first bin,
+    # so clip it into bin 0 (pd.cut's include_lowest)
+    bin_index = np.clip(np.digitize(values, edges, right=True) - 1, 0, len(edges) - 2)
 
-    bins = np.linspace(min_val, max_val, num_bins)
-    data_copy = data.copy()
-    data_copy['density_bin'] = pd.cut(data_copy[column], bins=bins)
+    return edges, bin_index
 
-    return data_copy, bins
+def aggregate_by_density(data, x_column, y_columns, num_bins=20):
+    """Mean of each y column per (algorithm, density bin center)"""
+    edges, bin_index = create_density_bins(data[x_column].to_numpy(), num_bins)
 
-def plot_metric_vs_density(ax, df, x_column, y_column, title, x_label, y_label, num_bins=20):
-    """Plot metric vs density with proper error handling"""
-    if df.empty:
+    if len(edges) <= 1:
+        return pd.DataFrame(columns=y_columns)
+
+    num_intervals = len(edges) - 1
+    bin_centers = (edges[:-1] + edges[1:]) / 2
+    algorithms = data['algorithm'].cat.categories
+    num_groups = len(algorithms) * num_intervals
+
+    # Fold (algorithm, bin) into one integer key so every column needs a
+    # single bincount over the whole frame
+    keys = data['algorithm'].cat.codes.to_numpy().astype(np.intp) * num_intervals + bin_index
+
+    counts = np.bincount(keys, minlength=num_groups)
+    occupied = counts > 0
+    if not occupied.any():
+        return pd.DataFrame(columns=y_columns)
+
+    means = {}
+    for y_column in y_columns:
+        y = data[y_column].to_numpy(dtype=np.float64)
+        sums = np.bincount(keys, weights=y, minlength=num_groups)
+        means[y_column] = sums[occupied] / counts[occupied]
+
+    index = pd.MultiIndex.from_product([algorithms, bin_centers],
+                                       names=['algorithm', 'density_bin'])
+    return pd.DataFrame(means, index=index[occupied])
+
+def plot_metric_vs_density(ax, density_means, title, x_label, y_label):
+    """Plot precomputed per-algorithm means indexed by (algorithm, density_bin)"""
+    if density_means.empty:
         ax.set_title(f"{title}\n(No data available)")
         return
 
     colors = {'a_star': 'blue', 'd_star_lite': 'red'}
     markers = {'a_star': 'o', 'd_star_lite': 's'}
 
-    for algorithm in ['a_star', 'd_star_lite']:
-        if algorithm not in df['algorithm'].values:
-            continue
-
-        algo_data = df[df['algorithm'] == algorithm]
-
-        if algo_data.empty:
-            continue
-
-        # Create density bins
-        algo_data_binned, bins = create_density_bins(algo_data, x_column, num_bins)
+    by_algorithm = density_means.unstack('algorithm')
 
-        if len(bins) <= 1:
+    for algorithm in ['a_star', 'd_star_lite']:
+        if algorithm not in by_algorithm.columns:
             continue
 
-        # Group by density bins and calculate mean
-        density_groups = algo_data_binned.groupby('density_bin')[y_column].mean()
+        density_groups = by_algorithm[algorithm].dropna()
 
-        # Extract bin centers and valid values
-        bin_centers = []
-        valid_values = []
-        for interval, value in density_groups.items():
-            if pd.notna(interval) and pd.notna(value):
-                bin_centers.append(interval.mid)
-                valid_values.append(value)
-
-        if len(bin_centers) > 0:
-            ax.plot(bin_centers, valid_values, marker=markers[algorithm],
-                   color=colors[algorithm], label=algorithm, linewidth=2)
+        if len(density_groups) > 0:
+            ax.plot(density_groups.index.to_numpy(), density_groups.to_numpy(dtype=np.float64),
+                   marker=markers[algorithm], color=colors[algorithm],
+                   label=algorithm, linewidth=2)
 
     ax.set_title(title)
     ax.set_xlabel(x_label)
@@ -136,28 +266,26 @@ def plot_metric_vs_density(ax, df, x_column, y_column, title, x_label, y_label,
     ax.legend()
     ax.grid(True, alpha=0.3)
 
-def plot_metric_vs_grid_size(ax, df, y_column, title, y_label, marker='s'):
-    """Plot metric vs grid size with proper error handling"""
-    if df.empty:
+def plot_metric_vs_grid_size(ax, size_means, title, y_label):
+    """Plot precomputed per-algorithm means indexed by (algorithm, grid_size)"""
+    if size_means.empty:
         ax.set_title(f"{title}\n(No data available)")
         return
 
     colors = {'a_star': 'blue', 'd_star_lite': 'red'}
     markers = {'a_star': 'o', 'd_star_lite': 's'}
 
-    for algorithm in ['a_star', 'd_star_lite']:
-        if algorithm not in df['algorithm'].values:
-            continue
-
-        algo_data = df[df['algorithm'] == algorithm]
+    # Slice each algorithm straight out of the (algorithm, grid_size) index
+    algorithms = size_means.index.unique(level='algorithm')
 
-        if algo_data.empty:
+    for algorithm in ['a_star', 'd_star_lite']:
+        if algorithm not in algorithms:
             continue
 
-        size_groups = algo_data.groupby('grid_size')[y_column].mean()
+        size_groups = size_means.xs(algorithm, level='algorithm').dropna()
 
         if len(size_groups) > 0:
-            ax.plot(size_groups.index.values, size_groups.values,
+            ax.plot(size_groups.index.to_numpy(), size_groups.to_numpy(dtype=np.float64),
                    marker=markers[algorithm], color=colors[algorithm],
                    label=algorithm, linewidth=2)
 
@@ -167,80 +295,128 @@ def plot_metric_vs_grid_size(ax, df, y_column, title, y_label, marker='s'):
     ax.legend()
     ax.grid(True, alpha=0.3)
 
-def create_visualizations(df, successful_df, failed_df):
+def compute_box_stats(values, label, whis=1.5):
+    """Box statistics for Axes.bxp with matplotlib's default IQR whiskers"""
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+
+    # Whiskers reach the furthest points within whis * IQR of the box, but
+    # never retract inside it (as in matplotlib.cbook.boxplot_stats)
+    upper = values[values <= q3 + whis * iqr]
+    whishi = upper.max() if len(upper) and upper.max() >= q3 else q3
+    lower = values[values >= q1 - whis * iqr]
+    whislo = lower.min() if len(lower) and lower.min() <= q1 else q1
+
+    return {
+        'label': label,
+        'med': median,
+        'q1': q1,
+        'q3': q3,
+        'whislo': whislo,
+        'whishi': whishi,
+        'fliers': values[(values < whislo) | (values > whishi)]
+    }
+
+def create_visualizations(df, succ_mask):
     """Create all 12 visualizations"""
-    # Create figure with subplots - 4x3 layout for 12 plots
-    fig = plt.figure(figsize=(20, 24))
+    # Create figure with subplots - 4x3 layout for 12 plots; constrained
+    # layout is solved once at draw time instead of a separate tight_layout pass
+    fig, axes = plt.subplots(4, 3, figsize=(20, 24), layout='constrained')
+    (ax1, ax2, ax3, ax4, ax5, ax6,
+     ax7, ax8, ax9, ax10, ax11, ax12) = axes.ravel()
+
+    # Only the density, box and scatter plots need the successful rows as a frame
+    successful_df = df.loc[succ_mask]
+
+    # Aggregate all grid-size metrics once instead of re-grouping per subplot;
+    # keying on success gives the successful and failed means in one pass.
+    # Keep the default key sort so grid sizes come out in ascending order
+    # whatever order the rows arrive in.
+    grid_metrics = ['find_path_time_ms', 'total_pathfinding_calls', 'execution_time_ms']
+    grid_by_outcome = df.groupby(['algorithm', 'success', 'grid_size'], observed=True)[grid_metrics].mean()
+    succeeded = grid_by_outcome.index.get_level_values('success').to_numpy(dtype=bool)
+    grid_means = grid_by_outcome[succeeded].droplevel('success')
+    failed_grid_means = grid_by_outcome.loc[~succeeded, 'find_path_time_ms'].droplevel('success')
+    grid_success = df.groupby(['algorithm', 'grid_size'], observed=True)['success'].mean()
+
+    # Bin each (frame, density column) pair once and aggregate all of its
+    # plotted metrics together, keyed by (frame, x column, y column)
+    density_means = {}
+    for frame_name, frame, x_column, y_columns in [
+        ('successful', successful_df, 'obstacle_density', ['find_path_time_ms', 'total_pathfinding_calls']),
+        ('all', df, 'obstacle_density', ['success']),
+        ('successful', successful_df, 'total_density', ['execution_time_ms']),
+    ]:
+        means = aggregate_by_density(frame, x_column, y_columns)
+        for y_column in y_columns:
+            density_means[(frame_name, x_column, y_column)] = means[y_column]
+
+    # Split by algorithm once and share the groups across subplots
+    successful_frames = {algorithm: group for algorithm, group in successful_df.groupby('algorithm', observed=True, sort=False)}
 
     # 1. Find Path Time vs Obstacle Density (successful runs)
-    ax1 = plt.subplot(4, 3, 1)
-    plot_metric_vs_density(ax1, successful_df, 'obstacle_density', 'find_path_time_ms',
+    plot_metric_vs_density(ax1, density_means[('successful', 'obstacle_density', 'find_path_time_ms')],
                           'Find Path Time vs Obstacle Density\n(Successful Runs)',
                           'Obstacle Density', 'Find Path Time (ms)')
 
     # 2. Find Path Time vs Grid Size (successful runs)
-    ax2 = plt.subplot(4, 3, 2)
-    plot_metric_vs_grid_size(ax2, successful_df, 'find_path_time_ms',
+    plot_metric_vs_grid_size(ax2, grid_means['find_path_time_ms'],
                             'Find Path Time vs Grid Size\n(Successful Runs)',
                             'Find Path Time (ms)')
 
     # 3. Success Rate vs Obstacle Density
-    ax3 = plt.subplot(4, 3, 3)
-    plot_metric_vs_density(ax3, df, 'obstacle_density', 'success',
+    plot_metric_vs_density(ax3, density_means[('all', 'obstacle_density', 'success')],
                           'Success Rate vs Obstacle Density\n(All Runs)',
                           'Obstacle Density', 'Success Rate')
 
     # 4. Success Rate vs Grid Size
-    ax4 = plt.subplot(4, 3, 4)
-    plot_metric_vs_grid_size(ax4, df, 'success',
+    plot_metric_vs_grid_size(ax4, grid_success,
                             'Success Rate vs Grid Size\n(All Runs)',
                             'Success Rate')
 
     # 5. Pathfinding Calls vs Obstacle Density
-    ax5 = plt.subplot(4, 3, 5)
-    plot_metric_vs_density(ax5, successful_df, 'obstacle_density', 'total_pathfinding_calls',
+    plot_metric_vs_density(ax5, density_means[('successful', 'obstacle_density', 'total_pathfinding_calls')],
                           'Pathfinding Calls vs Obstacle Density\n(Successful Runs)',
                           'Obstacle Density', 'Pathfinding Calls')
 
     # 6. Pathfinding Calls vs Grid Size
-    ax6 = plt.subplot(4, 3, 6)
-    plot_metric_vs_grid_size(ax6, successful_df, 'total_pathfinding_calls',
+    plot_metric_vs_grid_size(ax6, grid_means['total_pathfinding_calls'],
                             'Pathfinding Calls vs Grid Size\n(Successful Runs)',
                             'Pathfinding Calls')
 
     # 7. Execution Time vs Total Density
-    ax7 = plt.subplot(4, 3, 7)
-    plot_metric_vs_density(ax7, successful_df, 'total_density', 'execution_time_ms',
+    plot_metric_vs_density(ax7, density_means[('successful', 'total_density', 'execution_time_ms')],
                           'Execution Time vs Total Density\n(Successful Runs)',
                           'Total Density', 'Execution Time (ms)')
 
     # 8. Execution Time vs Grid Size
-    ax8 = plt.subplot(4, 3, 8)
-    plot_metric_vs_grid_size(ax8, successful_df, 'execution_time_ms',
+    plot_metric_vs_grid_size(ax8, grid_means['execution_time_ms'],
                             'Execution Time vs Grid Size\n(Successful Runs)',
                             'Execution Time (ms)')
 
     # 9. Find Path Time Distribution by Difficulty (Box plot)
-    ax9 = plt.subplot(4, 3, 9)
     if not successful_df.empty and 'difficulty_category' in successful_df.columns:
         try:
-            box_data = []
+            box_stats = []
             box_labels = []
             colors = ['blue', 'red']
 
             for i, algorithm in enumerate(['a_star', 'd_star_lite']):
-                if algorithm not in successful_df['algorithm'].values:
+                algo_data = successful_frames.get(algorithm)
+                if algo_data is None or algo_data.empty:
                     continue
 
-                algo_data = successful_df[successful_df['algorithm'] == algorithm]
+                category_frames = {category: group for category, group in algo_data.groupby('difficulty_category', observed=True, sort=False)}
                 for category in ['Low', 'Medium', 'High', 'Extreme']:
-                    cat_data = algo_data[algo_data['difficulty_category'] == category]
-                    if len(cat_data) > 0:
-                        box_data.append(cat_data['find_path_time_ms'].values)
-                        box_labels.append(f"{algorithm}\n{category}")
+                    cat_data = category_frames.get(category)
+                    if cat_data is not None and len(cat_data) > 0:
+                        label = f"{algorithm}\n{category}"
+                        box_stats.append(compute_box_stats(
+                            cat_data['find_path_time_ms'].to_numpy(dtype=np.float64), label))
+                        box_labels.append(label)
 
-            if box_data:
-                bp = ax9.boxplot(box_data, labels=box_labels, patch_artist=True)
+            if box_stats:
+                bp = ax9.bxp(box_stats, patch_artist=True)
 
                 # Color the boxes
                 for i, patch in enumerate(bp['boxes']):
@@ -260,23 +436,23 @@ def create_visualizations(df, successful_df, failed_df):
         ax9.set_title('Find Path Time Distribution\n(No data available)')
 
     # 10. Performance Degradation vs Grid Size
-    ax10 = plt.subplot(4, 3, 10)
     if not successful_df.empty:
         colors = {'a_star': 'blue', 'd_star_lite': 'red'}
         markers = {'a_star': 'o', 'd_star_lite': 's'}
+        find_time_by_size = grid_means['find_path_time_ms']
+        algorithms = find_time_by_size.index.unique(level='algorithm')
 
         for algorithm in ['a_star', 'd_star_lite']:
-            if algorithm not in successful_df['algorithm'].values:
+            if algorithm not in algorithms:
                 continue
 
-            algo_data = successful_df[successful_df['algorithm'] == algorithm]
-            size_groups = algo_data.groupby('grid_size')['find_path_time_ms'].mean()
+            size_groups = find_time_by_size.xs(algorithm, level='algorithm').dropna()
 
             if len(size_groups) > 1:
-                base_time = size_groups.iloc[0]
+                base_time = size_groups.loc[size_groups.index.min()]
                 if base_time > 0:
                     normalized_time = size_groups / base_time
-                    ax10.plot(size_groups.index.values, normalized_time.values,
+                    ax10.plot(size_groups.index.to_numpy(), normalized_time.to_numpy(dtype=np.float64),
                              marker=markers[algorithm], color=colors[algorithm],
                              label=algorithm, linewidth=2)
 
@@ -289,20 +465,19 @@ def create_visualizations(df, successful_df, failed_df):
         ax10.set_title('Performance Degradation\n(No data available)')
 
     # 11. Find Path Time on Failed Runs vs Grid Size
-    ax11 = plt.subplot(4, 3, 11)
-    if not failed_df.empty:
+    if not succ_mask.all():
         colors = {'a_star': 'blue', 'd_star_lite': 'red'}
         markers = {'a_star': 'o', 'd_star_lite': 's'}
+        algorithms = failed_grid_means.index.unique(level='algorithm')
 
         for algorithm in ['a_star', 'd_star_lite']:
-            if algorithm not in failed_df['algorithm'].values:
+            if algorithm not in algorithms:
                 continue
 
-            algo_data = failed_df[failed_df['algorithm'] == algorithm]
-            size_groups = algo_data.groupby('grid_size')['find_path_time_ms'].mean()
+            size_groups = failed_grid_means.xs(algorithm, level='algorithm').dropna()
 
             if len(size_groups) > 0:
-                ax11.plot(size_groups.index.values, size_groups.values,
+                ax11.plot(size_groups.index.to_numpy(), size_groups.to_numpy(dtype=np.float64),
                          marker=markers[algorithm], color=colors[algorithm],
                          label=algorithm, linewidth=2)
 
@@ -315,23 +490,29 @@ def create_visualizations(df, successful_df, failed_df):
         ax11.set_title('Find Path Time on Failed Runs\n(No failed runs)')
 
     # 12. Additional Graph: Algorithm Efficiency vs Problem Complexity
-    ax12 = plt.subplot(4, 3, 12)
     if not successful_df.empty:
         colors = {'a_star': 'blue', 'd_star_lite': 'red'}
 
+        # Calculate efficiency ratio for all runs at once: route efficiency / pathfinding calls
+        efficiency_ratio = (successful_df['route_efficiency'].to_numpy()
+                            / (successful_df['total_pathfinding_calls'].to_numpy() + 1).astype(np.float32))
+        combined_difficulty = successful_df['combined_difficulty'].to_numpy()
+        algorithm_codes = successful_df['algorithm'].cat.codes.to_numpy()
+        categories = list(successful_df['algorithm'].cat.categories)
+
         for algorithm in ['a_star', 'd_star_lite']:
-            if algorithm not in successful_df['algorithm'].values:
+            if algorithm not in categories:
                 continue
 
-            algo_data = successful_df[successful_df['algorithm'] == algorithm]
-
-            # Calculate efficiency ratio: route efficiency / pathfinding calls
-            algo_data = algo_data.copy()
-            algo_data['efficiency_ratio'] = algo_data['route_efficiency'] / (algo_data['total_pathfinding_calls'] + 1)
+            in_algorithm = algorithm_codes == categories.index(algorithm)
+            if not in_algorithm.any():
+                continue
 
-            # Plot efficiency ratio vs combined difficulty
-            ax12.scatter(algo_data['combined_difficulty'], algo_data['efficiency_ratio'],
-                        alpha=0.6, color=colors[algorithm], label=algorithm, s=30)
+            # Plot efficiency ratio vs combined difficulty; rasterize the
+            # points so vector outputs embed one bitmap instead of every marker
+            ax12.scatter(combined_difficulty[in_algorithm], efficiency_ratio[in_algorithm],
+                        alpha=0.6, color=colors[algorithm], label=algorithm, s=30,
+                        rasterized=True)
 
         ax12.set_title('Algorithm Efficiency vs Problem Complexity\n(Route Efficiency / Pathfinding Calls)')
         ax12.set_xlabel('Combined Difficulty (Walls + Obstacles)')
@@ -341,10 +522,9 @@ def create_visualizations(df, successful_df, failed_df):
     else:
         ax12.set_title('Algorithm Efficiency\n(No data available)')
 
-    plt.tight_layout()
     return fig
 
-def print_analysis_results(df, successful_df, failed_df, quiet=False):
+def print_analysis_results(df, succ_mask, quiet=False):
     """Print comprehensive analysis results"""
     if quiet:
         return
@@ -353,40 +533,52 @@ def print_analysis_results(df, successful_df, failed_df, quiet=False):
 
     # Success Rate Analysis
     print("\n1. Success Rate Analysis:")
-    success_stats = df.groupby('algorithm')['success'].agg(['count', 'sum', 'mean'])
-    success_stats['rate'] = success_stats['mean'] * 100
+    success_stats = df.groupby('algorithm', observed=True, sort=False).agg(
+        runs=('success', 'count'),
+        successes=('success', 'sum'),
+        success_mean=('success', 'mean')
+    )
+    success_stats['rate'] = success_stats['success_mean'] * 100
 
     for algorithm in ['a_star', 'd_star_lite']:
         if algorithm in success_stats.index:
             stats = success_stats.loc[algorithm]
-            print(f"  {algorithm}: {stats['rate']:.1f}% success ({stats['sum']}/{stats['count']} runs)")
+            print(f"  {algorithm}: {stats['rate']:.1f}% success ({stats['successes']}/{stats['runs']} runs)")
+
+    num_successful = int(succ_mask.sum())
+    num_failed = len(df) - num_successful
 
     # Performance metrics for successful runs
-    if not successful_df.empty:
+    if num_successful > 0:
         print("\n2. Performance Metrics (Successful Runs Only):")
 
-        perf_stats = successful_df.groupby('algorithm').agg({
-            'find_path_time_ms': ['mean', 'std'],
-            'execution_time_ms': ['mean', 'std'],
-            'total_pathfinding_calls': ['mean', 'std'],
-            'route_efficiency': ['mean', 'std']
-        }).round(3)
+        perf_stats = df.groupby(['algorithm', 'success'], observed=True, sort=False).agg(
+            find_time_mean=('find_path_time_ms', 'mean'),
+            find_time_std=('find_path_time_ms', 'std'),
+            exec_time_mean=('execution_time_ms', 'mean'),
+            exec_time_std=('execution_time_ms', 'std'),
+            calls_mean=('total_pathfinding_calls', 'mean'),
+            calls_std=('total_pathfinding_calls', 'std'),
+            efficiency_mean=('route_efficiency', 'mean'),
+            efficiency_std=('route_efficiency', 'std')
+        ).round(3)
+        perf_stats = perf_stats[perf_stats.index.get_level_values('success').to_numpy(dtype=bool)].droplevel('success')
 
         for algorithm in ['a_star', 'd_star_lite']:
             if algorithm in perf_stats.index:
                 print(f"\n  {algorithm}:")
-                print(f"    Find Path Time: {perf_stats.loc[algorithm, ('find_path_time_ms', 'mean')]:.3f} ± {perf_stats.loc[algorithm, ('find_path_time_ms', 'std')]:.3f} ms")
-                print(f"    Execution Time: {perf_stats.loc[algorithm, ('execution_time_ms', 'mean')]:.3f} ± {perf_stats.loc[algorithm, ('execution_time_ms', 'std')]:.3f} ms")
-                print(f"    Pathfinding Calls: {perf_stats.loc[algorithm, ('total_pathfinding_calls', 'mean')]:.1f} ± {perf_stats.loc[algorithm, ('total_pathfinding_calls', 'std')]:.1f}")
-                print(f"    Route Efficiency: {perf_stats.loc[algorithm, ('route_efficiency', 'mean')]:.3f} ± {perf_stats.loc[algorithm, ('route_efficiency', 'std')]:.3f}")
+                print(f"    Find Path Time: {perf_stats.loc[algorithm, 'find_time_mean']:.3f} ± {perf_stats.loc[algorithm, 'find_time_std']:.3f} ms")
+                print(f"    Execution Time: {perf_stats.loc[algorithm, 'exec_time_mean']:.3f} ± {perf_stats.loc[algorithm, 'exec_time_std']:.3f} ms")
+                print(f"    Pathfinding Calls: {perf_stats.loc[algorithm, 'calls_mean']:.1f} ± {perf_stats.loc[algorithm, 'calls_std']:.1f}")
+                print(f"    Route Efficiency: {perf_stats.loc[algorithm, 'efficiency_mean']:.3f} ± {perf_stats.loc[algorithm, 'efficiency_std']:.3f}")
 
     # Summary Statistics
     print(f"\n=== SUMMARY STATISTICS ===")
     print(f"Total records: {len(df)}")
-    print(f"Successful runs: {len(successful_df)}")
-    print(f"Failed runs: {len(failed_df)}")
-    print(f"Overall success rate: {len(successful_df) / len(df) * 100:.1f}%")
-    print(f"Grid sizes: {sorted(df['grid_size'].unique())}")
+    print(f"Successful runs: {num_successful}")
+    print(f"Failed runs: {num_failed}")
+    print(f"Overall success rate: {num_successful / len(df) * 100:.1f}%")
+    print(f"Grid sizes: {sorted(df['grid_size'].unique().tolist())}")
     print(f"Difficulty range: {df['combined_difficulty'].min()}-{df['combined_difficulty'].max()}")
 
 def main():
@@ -396,6 +588,10 @@ def main():
     parser.add_argument('input_csv', help='Input CSV file path')
     parser.add_argument('output_image', help='Output image file path (e.g., analysis.png)')
     parser.add_argument('--quiet', '-q', action='store_true', help='Suppress printed output')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-read the CSV and neither read nor write the .cache/ copy')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help='Re-read the CSV and overwrite its .cache/ copy')
 
     args = parser.parse_args()
 
@@ -410,17 +606,20 @@ def main():
         print(f"Error: Output directory '{output_dir}' does not exist")
         sys.exit(1)
 
+    # Output is only ever written to file; skip GUI backend setup
+    load_libraries(backend='Agg')
+
+    # Suppress warnings for cleaner output
+    warnings.filterwarnings('ignore')
+
     # Set up plotting style
-    plt.style.use('default')
     sns.set_palette("husl")
 
     try:
-        # Read and validate CSV
-        df = pd.read_csv(args.input_csv)
-        df = validate_csv_columns(df)
-
-        # Calculate derived metrics (includes filtering to a_star and d_star_lite only)
-        df = calculate_metrics(df)
+        # Read and validate CSV, then calculate derived metrics (includes
+        # filtering to a_star and d_star_lite only)
+        df = load_analysis_data(args.input_csv, use_cache=not args.no_cache,
+                                refresh_cache=args.refresh_cache)
 
         if df.empty:
             print("Error: No data found for a_star or d_star_lite algorithms")
@@ -428,18 +627,17 @@ def main():
 
         if not args.quiet:
             print(f"Loaded {len(df)} records from {args.input_csv}")
-            print(f"Algorithms found: {df['algorithm'].unique()}")
+            print(f"Algorithms found: {df['algorithm'].unique().tolist()}")
 
-        # Filter successful and failed runs
-        successful_df = df[df['success'] == True]
-        failed_df = df[df['success'] == False]
+        # Mark successful runs; frames are only sliced where a plot needs one
+        succ_mask = df['success'].to_numpy(dtype=bool)
 
         if not args.quiet:
-            print(f"Successful runs: {len(successful_df)}")
-            print(f"Failed runs: {len(failed_df)}")
+            print(f"Successful runs: {int(succ_mask.sum())}")
+            print(f"Failed runs: {int((~succ_mask).sum())}")
 
         # Create visualizations
-        fig = create_visualizations(df, successful_df, failed_df)
+        fig = create_visualizations(df, succ_mask)
 
         # Save figure
         fig.savefig(args.output_image, dpi=300, bbox_inches='tight')
@@ -448,10 +646,7 @@ def main():
             print(f"Graph saved to {args.output_image}")
 
         # Print analysis results
-        print_analysis_results(df, successful_df, failed_df, args.quiet)
-
-        if not args.quiet:
-            plt.show()
+        print_analysis_results(df, succ_mask, args.quiet)
 
     except Exception as e:
         print(f"Error: {e}")
@@ -459,3 +654,6 @@ def main():
 
 if __name__ == "__main__":
     main()
+else:
+    # Imported as a module: the helpers above need the libraries loaded
+    load_libraries()